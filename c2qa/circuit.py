@@ -3,11 +3,64 @@ import warnings
 
 import numpy as np
 from qiskit import QuantumCircuit, QuantumRegister
+from qiskit.circuit import Gate
 from qiskit.extensions import UnitaryGate
+from qiskit.extensions.quantum_initializer import DiagonalGate
 
 from c2qa.operators import CVOperators
 from c2qa.qumoderegister import QumodeRegister
 
+# Labels given to the unitaries appended by the bosonic gates, which fuse_cv() may combine.
+_CV_LABELS = {"BS", "D", "R", "S", "S2"}
+
+
+class _ConditionalGate(Gate):
+    """Apply op_0 to the target qumode(s) where the control qubit (first) is 0 and op_1 where it is 1.
+
+    Named "multiplexer" so Aer applies it natively, multiplying each half of the statevector by
+    only its own operator. Other simulators fall back to the equivalent block diagonal unitary.
+    """
+
+    def __init__(self, op_0, op_1, label: str = None):
+        num_qubits = int(np.log2(len(op_0))) + 1
+        super().__init__("multiplexer", num_qubits, [op_0, op_1], label=label)
+
+    def validate_parameter(self, parameter):
+        return np.asarray(parameter, dtype=complex)
+
+    def _define(self):
+        op_0, op_1 = self.params
+        ctrl_0 = np.diag([1, 0])
+        ctrl_1 = np.diag([0, 1])
+
+        # Qiskit treats the first qubit (the control) as least significant
+        operator = np.kron(op_0, ctrl_0) + np.kron(op_1, ctrl_1)
+
+        qr = QuantumRegister(self.num_qubits, "q")
+        definition = QuantumCircuit(qr, name=self.name)
+        definition.unitary(operator, qr[:], label=self.label)
+        self.definition = definition
+
+
+class _DiagonalGate(DiagonalGate):
+    """Diagonal gate that Aer applies natively, but exported to QASM as the equivalent unitary.
+
+    DiagonalGate has no QASM definition (its complex parameters aren't valid QASM), so the
+    gate definition is written by a UnitaryGate with the same matrix and label instead.
+    """
+
+    def __init__(self, diag, label: str = None):
+        super().__init__(list(diag))
+        self.label = label
+        self._qasm_unitary = None
+
+    def qasm(self):
+        if self._qasm_unitary is None:
+            self._qasm_unitary = UnitaryGate(np.diag(self.params), label=self.label)
+        self._qasm_unitary.condition = self.condition
+
+        return self._qasm_unitary.qasm()
+
 
 class CVCircuit(QuantumCircuit):
     def __init__(self, *regs, name: str = None, animation_segments: int = math.nan):
@@ -55,7 +108,7 @@ class CVCircuit(QuantumCircuit):
         self.animation_steps += 1
 
     def cv_initialize(self, fock_state, qumodes):
-        """ Initialize the qumode to a Fock state. """
+        """ Initialize the qumode to a Fock state (or each qumode to its own Fock state, if given a list). """
 
         # Qumodes are already represented as arrays of qubits,
         # but if this is an array of arrays, then we are initializing multiple qumodes.
@@ -63,50 +116,140 @@ class CVCircuit(QuantumCircuit):
         if not isinstance(qumodes[0], list):
             modes = [qumodes]
 
-        if fock_state > self.qmregs[-1].cutoff:
-            raise ValueError("The given Fock state is greater than the cutoff.")
+        cutoff = self.qmregs[-1].cutoff
+        fock_states = np.broadcast_to(fock_state, (len(modes),))
+
+        if np.any(fock_states != np.round(fock_states)):
+            raise ValueError("The given Fock state is not an integer.")
+        if np.any((fock_states < 0) | (fock_states >= cutoff)):
+            raise ValueError("The given Fock state is negative or not less than the cutoff.")
+        fock_states = fock_states.astype(int)
+
+        # Initialize every qumode with a single instruction on the tensor product of their Fock states.
+        # Qiskit treats the first qubit as least significant, so each successive qumode is a higher "digit".
+        value = np.zeros((cutoff ** len(modes),))
+        value[np.dot(fock_states, cutoff ** np.arange(len(modes)))] = 1
+
+        super().initialize(value, [qubit for qumode in modes for qubit in qumode])
+
+    def cv_conditional(self, name, op_0, op_1, num_qumodes: int = None):
+        """ Make two operators conditional (i.e., controlled by qubit in either the 0 or 1 state)
+
+        Returns a single gate to append on [ctrl] + qumode qubits, applying op_0 to the qumode(s)
+        where the control is 0 and op_1 where it is 1, without embedding either in a larger matrix.
+        The gate is named "multiplexer" (so Aer applies it natively) and labeled with the given name.
+        The number of qumodes follows from the size of the operators, so num_qumodes is deprecated and ignored.
+        """
+        if num_qumodes is not None:
+            warnings.warn(
+                "The num_qumodes argument of cv_conditional is deprecated and ignored, as it follows from the operator size.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
 
-        for qumode in modes:
-            value = np.zeros((self.qmregs[-1].cutoff,))
-            value[fock_state] = 1
+        return _ConditionalGate(op_0, op_1, label=name)
 
-            super().initialize(value, [qumode])
+    def fuse_cv(self):
+        """Fold consecutive bosonic gates acting on the same qumode(s) into a single unitary.
 
-    def cv_conditional(self, name, op_0, op_1, num_qumodes = 1):
-        """ Make two operators conditional (i.e., controlled by qubit in either the 0 or 1 state) """
-        sub_qr = QuantumRegister(1)
-        sub_qmr = QumodeRegister(num_qumodes, self.qmregs[-1].num_qubits_per_mode)
-        sub_circ = QuantumCircuit(sub_qr, sub_qmr.qreg, name=name)
+        Any run of BS, D, R, S or S2 gates on the same qubits is replaced by one gate whose
+        matrix is their product, so the simulator applies one Fock space matrix instead of
+        one per gate (e.g., G(theta) followed by G(-theta) becomes one identity). Gates on
+        other qubits in between don't break the run, as they commute with it; any other
+        instruction touching those qubits (including animation snapshots and classically
+        conditioned bosonic gates, which are never fused) does.
+        A run of only diagonal gates stays diagonal.
+        """
+        data = []
 
-        # TODO Use size of op_0 and op_1 to calculate the number of qumodes instead of using parameter
-        qargs = [sub_qr[0]]
-        for i in range(num_qumodes):
-            qargs += sub_qmr[i]
+        # Qubits of each gate that may still be fused -> its index in data
+        open_gates = {}
 
-        sub_circ.append(
-            UnitaryGate(op_0).control(num_ctrl_qubits=1, ctrl_state=0),
-            qargs
-        )
-        sub_circ.append(
-            UnitaryGate(op_1).control(num_ctrl_qubits=1, ctrl_state=1),
-            qargs
+        for inst, qargs, cargs in self.data:
+            key = tuple(qargs)
+
+            if self._is_cv_gate(inst) and key in open_gates:
+                index = open_gates[key]
+                data[index] = (self._fuse(data[index][0], inst), qargs, cargs)
+                continue
+
+            touched = set(qargs)
+            for other in [other for other in open_gates if touched.intersection(other)]:
+                del open_gates[other]
+
+            if self._is_cv_gate(inst):
+                open_gates[key] = len(data)
+            data.append((inst, qargs, cargs))
+
+        self.data = data
+
+    @classmethod
+    def _fuse(cls, prev_inst, inst):
+        """Return a single gate applying prev_inst followed by inst."""
+        label = prev_inst.label
+        if label != inst.label:
+            label = f"{prev_inst.label}+{inst.label}"
+
+        if prev_inst.name == inst.name == "diagonal":
+            gate = _DiagonalGate(np.multiply(inst.params, prev_inst.params), label=label)
+        else:
+            matrix = np.matmul(cls._cv_matrix(inst), cls._cv_matrix(prev_inst))
+            gate = UnitaryGate(matrix, label=label)
+
+        return gate
+
+    @staticmethod
+    def _is_cv_gate(inst):
+        """Return True if the instruction was appended by one of the bosonic gates (or their fusion).
+
+        Classically conditioned gates are excluded, as fusing would drop (or reorder) their condition.
+        """
+        return (
+            inst.condition is None
+            and inst.name in ("unitary", "diagonal")
+            and inst.label is not None
+            and set(inst.label.split("+")) <= _CV_LABELS
         )
 
-        return sub_circ.to_instruction()
+    @staticmethod
+    def _cv_matrix(inst):
+        """Return the Fock space matrix of a gate accepted by _is_cv_gate()."""
+        if inst.name == "diagonal":
+            return np.diag(inst.params)
+        return inst.to_matrix()
+
+    @staticmethod
+    def _is_identity(*params):
+        """Return True if every gate parameter is zero, i.e., the gate is the identity and can be skipped."""
+        return all(np.isclose(param, 0) for param in params)
+
+    def _diagonal(self, diag, qubits, label: str):
+        """Append a diagonal operator, which Aer applies natively touching only the diagonal entries."""
+        return self.append(_DiagonalGate(diag, label=label), qubits)
 
     def cv_bs(self, phi, qumode_a, qumode_b):
+        if self._is_identity(phi):
+            return
+
+        qubits = qumode_a + qumode_b
+
         if self.animated:
             segment = phi / self._animation_segments
 
             for _ in range(self._animation_segments):
                 operator = self.ops.bs(segment)
-                self.unitary(obj=operator, qubits=qumode_a + qumode_b, label="BS")
+                self.unitary(obj=operator, qubits=qubits, label="BS")
                 self._snapshot_animation()
         else:
             operator = self.ops.bs(phi)
-            self.unitary(obj=operator, qubits=qumode_a + qumode_b, label="BS")
+            self.unitary(obj=operator, qubits=qubits, label="BS")
 
     def cv_cnd_bs(self, phi, chi, ctrl, qumode_a, qumode_b):
+        if self._is_identity(phi, chi):
+            return
+
+        qubits = [ctrl] + qumode_a + qumode_b
+
         if self.animated:
             segment_phi = phi / self._animation_segments
             segment_chi = chi / self._animation_segments
@@ -114,18 +257,21 @@ class CVCircuit(QuantumCircuit):
             for _ in range(self._animation_segments):
                 self.append(
                     self.cv_conditional(
-                        "BSc", self.ops.bs(segment_phi), self.ops.bs(segment_chi), num_qumodes=2
+                        "BSc", self.ops.bs(segment_phi), self.ops.bs(segment_chi)
                     ),
-                    [ctrl] + qumode_a + qumode_b
+                    qubits
                 )
                 self._snapshot_animation()
         else:
             self.append(
-                self.cv_conditional("BSc", self.ops.bs(phi), self.ops.bs(chi), num_qumodes=2),
-                [ctrl] + qumode_a + qumode_b
+                self.cv_conditional("BSc", self.ops.bs(phi), self.ops.bs(chi)),
+                qubits
             )
 
     def cv_d(self, alpha, qumode):
+        if self._is_identity(alpha):
+            return
+
         if self.animated:
             segment = alpha / self._animation_segments
 
@@ -138,6 +284,11 @@ class CVCircuit(QuantumCircuit):
             self.unitary(obj=operator, qubits=qumode, label="D")
 
     def cv_cnd_d(self, alpha, beta, ctrl, qumode):
+        if self._is_identity(alpha, beta):
+            return
+
+        qubits = [ctrl] + qumode
+
         if self.animated:
             segment_alpha = alpha / self._animation_segments
             segment_beta = beta / self._animation_segments
@@ -147,28 +298,32 @@ class CVCircuit(QuantumCircuit):
                     self.cv_conditional(
                         "Dc", self.ops.d(segment_alpha), self.ops.d(segment_beta)
                     ),
-                    [ctrl] + qumode
+                    qubits
                 )
                 self._snapshot_animation()
         else:
             self.append(
                 self.cv_conditional("Dc", self.ops.d(alpha), self.ops.d(beta)),
-                [ctrl] + qumode
+                qubits
             )
 
     def cv_r(self, phi, qumode):
+        if self._is_identity(phi):
+            return
+
         if self.animated:
             segment = phi / self._animation_segments
 
             for _ in range(self._animation_segments):
-                operator = self.ops.r(segment)
-                self.unitary(obj=operator, qubits=qumode, label="R")
+                self._diagonal(self.ops.r_diagonal(segment), qumode, label="R")
                 self._snapshot_animation()
         else:
-            operator = self.ops.r(phi)
-            self.unitary(obj=operator, qubits=qumode, label="R")
+            self._diagonal(self.ops.r_diagonal(phi), qumode, label="R")
 
     def cv_s(self, z, qumode):
+        if self._is_identity(z):
+            return
+
         if self.animated:
             segment = z / self._animation_segments
 
@@ -181,6 +336,11 @@ class CVCircuit(QuantumCircuit):
             self.unitary(obj=operator, qubits=qumode, label="S")
 
     def cv_cnd_s(self, z_a, z_b, ctrl, qumode_a):
+        if self._is_identity(z_a, z_b):
+            return
+
+        qubits = [ctrl] + qumode_a
+
         if self.animated:
             segment_z_a = z_a / self._animation_segments
             segment_z_b = z_b / self._animation_segments
@@ -190,23 +350,28 @@ class CVCircuit(QuantumCircuit):
                     self.cv_conditional(
                         "Sc", self.ops.s(segment_z_a), self.ops.s(segment_z_b)
                     ),
-                    [ctrl] + qumode_a
+                    qubits
                 )
                 self._snapshot_animation()
         else:
             self.append(
                 self.cv_conditional("Sc", self.ops.s(z_a), self.ops.s(z_b)),
-                [ctrl] + qumode_a
+                qubits
             )
 
     def cv_s2(self, z, qumode_a, qumode_b):
+        if self._is_identity(z):
+            return
+
+        qubits = qumode_a + qumode_b
+
         if self.animated:
             segment = z / self._animation_segments
 
             for _ in range(self._animation_segments):
                 operator = self.ops.s2(segment)
-                self.unitary(obj=operator, qubits=qumode_a + qumode_b, label="S2")
+                self.unitary(obj=operator, qubits=qubits, label="S2")
                 self._snapshot_animation()
         else:
             operator = self.ops.s2(z)
-            self.unitary(obj=operator, qubits=qumode_a + qumode_b, label="S2")
+            self.unitary(obj=operator, qubits=qubits, label="S2")
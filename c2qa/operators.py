@@ -1,65 +1,149 @@
+import functools
+
 import numpy as np
-from scipy.linalg import expm
+
+from c2qa import fock_ops
 
 
 class CVOperators:
     def __init__(self, cutoff: int):
-        # Annihilation operator
-        self.a = np.diag(np.sqrt(range(1, cutoff)), k=1)
-
-        # Creation operator
-        self.a_dag = self.a.conj().T
-
-        # Number operator
-        self.N = np.matmul(self.a_dag, self.a)
-
-        # 2-qumodes operators
-        eye = np.eye(cutoff)
-        self.a1 = np.kron(self.a, eye)
-        self.a2 = np.kron(eye, self.a)
-        self.a1_dag = self.a1.conj().T
-        self.a2_dag = self.a2.conj().T
+        self.cutoff = cutoff
+
+    # The ladder operators are no longer needed to build the gates, so they are only
+    # computed on request rather than for every circuit (the 2-qumode operators alone
+    # are dense cutoff^2 by cutoff^2 matrices).
+
+    @property
+    def a(self):
+        """ Annihilation operator """
+        return np.diag(np.sqrt(range(1, self.cutoff)), k=1)
+
+    @property
+    def a_dag(self):
+        """ Creation operator """
+        return self.a.conj().T
+
+    @property
+    def N(self):
+        """ Number operator """
+        return np.diag(np.arange(self.cutoff, dtype=float))
+
+    @property
+    def a1(self):
+        """ Annihilation operator of the first of 2-qumodes """
+        return np.kron(self.a, np.eye(self.cutoff))
+
+    @property
+    def a2(self):
+        """ Annihilation operator of the second of 2-qumodes """
+        return np.kron(np.eye(self.cutoff), self.a)
+
+    @property
+    def a1_dag(self):
+        """ Creation operator of the first of 2-qumodes """
+        return self.a1.conj().T
+
+    @property
+    def a2_dag(self):
+        """ Creation operator of the second of 2-qumodes """
+        return self.a2.conj().T
 
     def bs(self, g):
         """ Two-mode beam splitter opertor """
-        a12dag = np.matmul(self.a1, self.a2_dag)
-        a1dag2 = np.matmul(self.a1_dag, self.a2)
-
-        # FIXME -- See Steve 5.4
-        #   phi as g(t)
-        #   - as +, but QisKit validates that not being unitary
-        arg = (g * -1j * a12dag) - (np.conjugate(g * -1j) * a1dag2)
-
-        return expm(arg)
+        return _cached_op("bs", g, self.cutoff)
 
     def d(self, alpha):
         """ Displacement operator """
-        arg = (alpha * self.a_dag) - (np.conjugate(alpha) * self.a)
-
-        return expm(arg)
+        return _cached_op("d", alpha, self.cutoff)
 
     def r(self, theta):
         """ Phase space rotation operator """
-        arg = 1j * theta * self.N
+        return _cached_op("r", theta, self.cutoff)
 
-        return expm(arg)
+    def r_diagonal(self, theta):
+        """ Diagonal entries e^(i theta n) of the phase space rotation operator """
+        return np.exp(1j * theta * np.arange(self.cutoff))
 
     def s(self, zeta):
         """ Single-mode squeezing operator """
-        a_sqr = np.matmul(self.a, self.a)
-        a_dag_sqr = np.matmul(self.a_dag, self.a_dag)
-        arg = 0.5 * ((np.conjugate(zeta) * a_sqr) - (zeta * a_dag_sqr))
-
-        return expm(arg)
+        return _cached_op("s", zeta, self.cutoff)
 
     def s2(self, g):
         """ Two-mode squeezing operator """
-        a12_dag = np.matmul(self.a1_dag, self.a2_dag)
-        a12 = np.matmul(self.a1, self.a2)
+        return _cached_op("s2", g, self.cutoff)
+
+
+def _bs(g, cutoff: int):
+    """ Two-mode beam splitter opertor """
+    return fock_ops.beamsplitter(g, cutoff)
+
+
+def _d(alpha, cutoff: int):
+    """ Displacement operator """
+    return fock_ops.displacement(np.abs(alpha), np.angle(alpha), cutoff)
+
+
+def _r(theta, cutoff: int):
+    """ Phase space rotation operator """
+    return np.diag(np.exp(1j * theta * np.arange(cutoff)))
+
+
+def _s(zeta, cutoff: int):
+    """ Single-mode squeezing operator """
+    return fock_ops.squeezing(np.abs(zeta), np.angle(zeta), cutoff)
+
+
+def _s2(g, cutoff: int):
+    """ Two-mode squeezing operator """
+    return fock_ops.two_mode_squeezing(g, cutoff)
+
+
+_BUILDERS = {"bs": _bs, "d": _d, "r": _r, "s": _s, "s2": _s2}
+
+
+def _canonical(param, digits: int = 12):
+    """Round the parameter so equal values share a cache key, then fold negations together.
+
+    Every operator above is the exponential of a generator linear in its parameter, so
+    op(-param) is the adjoint of op(param). Returns the parameter with a
+    non-negative leading component and whether the adjoint must be taken.
+    """
+    param = complex(param)
+    param = complex(round(param.real, digits), round(param.imag, digits))
+
+    if param.real < 0 or (param.real == 0 and param.imag < 0):
+        return -param, True
+    return param, False
+
+
+# The cache holds at most _CACHE_SIZE operators, each no larger than _CACHE_MAX_DIM squared
+# complex entries (1 MiB), so it stays within 64 MiB. Larger operators (e.g., two-qumode
+# gates with a cutoff above 16) are rebuilt on every call rather than held in memory.
+_CACHE_SIZE = 64
+_CACHE_MAX_DIM = 256
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _build_op(kind: str, param: complex, cutoff: int):
+    """ Build the Fock space matrix once per (kind, param, cutoff), frozen so callers can't alter the cache. """
+    operator = _BUILDERS[kind](param, cutoff)
+    operator.flags.writeable = False
+
+    return operator
+
+
+def _cached_op(kind: str, param, cutoff: int):
+    param, adjoint = _canonical(param)
+
+    dim = cutoff * cutoff if kind in ("bs", "s2") else cutoff
 
-        # FIXME -- See Steve 5.7
-        #   zeta as g(t)
-        #   use of imaginary, but QisKit validates that is not unitary
-        arg = (np.conjugate(g) * a12_dag) - (g * a12)
+    if dim > _CACHE_MAX_DIM:
+        operator = _BUILDERS[kind](param, cutoff)
+        operator.flags.writeable = False
+    else:
+        operator = _build_op(kind, param, cutoff)
 
-        return expm(arg)
+    # Take the adjoint of the cached operator on request, rather than caching a second copy
+    if adjoint:
+        return operator.conj().T
+    return operator
@@ -1,4 +1,5 @@
 import c2qa
+import numpy
 import pytest
 import qiskit
 
@@ -33,3 +34,71 @@ def test_with_classical():
         c2qa.QumodeRegister(1, 1),
         qiskit.ClassicalRegister(1),
     )
+
+
+def test_initialize_multiple_qumodes():
+    qmr = c2qa.QumodeRegister(2, 2)
+    circuit = c2qa.CVCircuit(qmr)
+    circuit.cv_initialize([1, 2], [qmr[0], qmr[1]])
+
+    state = qiskit.quantum_info.Statevector.from_instruction(circuit)
+
+    assert len(circuit.data) == 1
+    assert numpy.isclose(state.data[1 + (2 * qmr.cutoff)], 1)
+
+
+def test_initialize_above_cutoff():
+    qmr = c2qa.QumodeRegister(2, 2)
+    circuit = c2qa.CVCircuit(qmr)
+
+    with pytest.raises(ValueError):
+        circuit.cv_initialize(qmr.cutoff, qmr[0])
+
+    with pytest.raises(ValueError):
+        circuit.cv_initialize([-1, 0], [qmr[0], qmr[1]])
+
+    with pytest.raises(ValueError):
+        circuit.cv_initialize(1.5, qmr[0])
+
+    assert len(circuit.data) == 0
+
+
+def test_qasm_rotation():
+    qmr = c2qa.QumodeRegister(1, 2)
+    circuit = c2qa.CVCircuit(qmr)
+    circuit.cv_r(0.3, qmr[0])
+    circuit.cv_r(0.2, qmr[0])
+    circuit.fuse_cv()
+
+    qasm = circuit.qasm()
+
+    assert "gate R " in qasm
+    assert "diagonal" not in qasm
+
+
+def test_conditional_num_qumodes_deprecated():
+    qmr = c2qa.QumodeRegister(2, 2)
+    circuit = c2qa.CVCircuit(qmr)
+
+    with pytest.warns(DeprecationWarning):
+        gate = circuit.cv_conditional("BSc", circuit.ops.bs(0.1), circuit.ops.bs(0.2), num_qumodes=2)
+
+    assert gate.num_qubits == 1 + 2 * qmr.num_qubits_per_mode
+    assert gate.label == "BSc"
+
+
+def test_identity_gates_skipped():
+    qmr = c2qa.QumodeRegister(2, 2)
+    qr = qiskit.QuantumRegister(1)
+    circuit = c2qa.CVCircuit(qmr, qr)
+
+    circuit.cv_bs(0, qmr[0], qmr[1])
+    circuit.cv_d(0, qmr[0])
+    circuit.cv_r(0, qmr[0])
+    circuit.cv_s(0, qmr[0])
+    circuit.cv_s2(0, qmr[0], qmr[1])
+    circuit.cv_cnd_d(0, 0, qr[0], qmr[0])
+    assert len(circuit.data) == 0
+
+    circuit.cv_cnd_d(0, 1, qr[0], qmr[0])
+    assert len(circuit.data) == 1
@@ -0,0 +1,88 @@
+import random
+
+import numpy
+import scipy.linalg
+from c2qa import fock_ops
+from qiskit.quantum_info.operators.predicates import is_unitary_matrix
+
+
+def annihilation(cutoff: int):
+    return numpy.diag(numpy.sqrt(range(1, cutoff)), k=1)
+
+
+class TestDisplacement:
+    """Verify the closed form matches exponentiating the truncated generator"""
+
+    def test_matches_expm(self):
+        for cutoff in [1, 2, 4, 16]:
+            a = annihilation(cutoff)
+            alpha = complex(random.uniform(-2, 2), random.uniform(-2, 2))
+            expected = scipy.linalg.expm((alpha * a.conj().T) - (numpy.conjugate(alpha) * a))
+
+            op = fock_ops.displacement(numpy.abs(alpha), numpy.angle(alpha), cutoff)
+
+            assert numpy.allclose(op, expected)
+
+    def test_unitary(self):
+        assert is_unitary_matrix(fock_ops.displacement(random.random(), random.random(), 32))
+
+    def test_large_cutoff(self):
+        cutoff = 512
+        a = annihilation(cutoff)
+        alpha = complex(random.uniform(-2, 2), random.uniform(-2, 2))
+        expected = scipy.linalg.expm((alpha * a.conj().T) - (numpy.conjugate(alpha) * a))
+
+        op = fock_ops.displacement(numpy.abs(alpha), numpy.angle(alpha), cutoff)
+
+        assert is_unitary_matrix(op)
+        assert numpy.allclose(op, expected)
+
+
+class TestSqueezing:
+    """Verify the closed form matches exponentiating the truncated generator"""
+
+    def test_matches_expm(self):
+        for cutoff in [1, 2, 3, 4, 16]:
+            a = annihilation(cutoff)
+            a_dag = a.conj().T
+            zeta = complex(random.uniform(-2, 2), random.uniform(-2, 2))
+            expected = scipy.linalg.expm(0.5 * ((numpy.conjugate(zeta) * a @ a) - (zeta * a_dag @ a_dag)))
+
+            op = fock_ops.squeezing(numpy.abs(zeta), numpy.angle(zeta), cutoff)
+
+            assert numpy.allclose(op, expected)
+
+    def test_unitary(self):
+        assert is_unitary_matrix(fock_ops.squeezing(random.random(), random.random(), 32))
+
+
+class TestTwoMode:
+    """Verify the sector-wise operators match exponentiating the full generator"""
+
+    def setup_method(self, method):
+        self.cutoff = 4
+        eye = numpy.eye(self.cutoff)
+        self.a1 = numpy.kron(annihilation(self.cutoff), eye)
+        self.a2 = numpy.kron(eye, annihilation(self.cutoff))
+
+    def test_beamsplitter(self):
+        g = complex(random.random(), random.random())
+        a12dag = self.a1 @ self.a2.T
+        expected = scipy.linalg.expm((g * -1j * a12dag) - (numpy.conjugate(g * -1j) * a12dag.T))
+
+        assert numpy.allclose(fock_ops.beamsplitter(g, self.cutoff), expected)
+
+    def test_two_mode_squeezing(self):
+        g = complex(random.random(), random.random())
+        a12 = self.a1 @ self.a2
+        expected = scipy.linalg.expm((numpy.conjugate(g) * a12.T) - (g * a12))
+
+        assert numpy.allclose(fock_ops.two_mode_squeezing(g, self.cutoff), expected)
+
+    def test_selection_rule(self):
+        n1, n2 = numpy.divmod(numpy.arange(self.cutoff ** 2), self.cutoff)
+        total = n1 + n2
+
+        op = fock_ops.beamsplitter(random.random(), self.cutoff)
+
+        assert numpy.all(op[total[:, numpy.newaxis] != total[numpy.newaxis, :]] == 0)
@@ -6,13 +6,8 @@ import qiskit
 
 
 def count_nonzero(statevector):
-    """Re-implement numpy.count_nonzero using numpy.isclose()."""
-    nonzero = len(statevector)
-    for state in statevector:
-        if numpy.isclose(state, 0):
-            nonzero -= 1
-
-    return nonzero
+    """Re-implement numpy.count_nonzero, treating amplitudes within single precision noise of zero as zero."""
+    return int(numpy.count_nonzero(numpy.abs(numpy.asarray(statevector)) > 1e-5))
 
 
 def create_conditional(num_qumodes: int = 2, num_qubits_per_mode: int = 2):
@@ -20,8 +15,7 @@ def create_conditional(num_qumodes: int = 2, num_qubits_per_mode: int = 2):
     qr = qiskit.QuantumRegister(2)
     circuit = c2qa.CVCircuit(qmr, qr)
 
-    for qumode in range(num_qumodes):
-        circuit.cv_initialize(0, qmr[qumode])
+    circuit.cv_initialize(0, [qmr[qumode] for qumode in range(num_qumodes)])
 
     circuit.initialize([0, 1], qr[1])  # qr[0] will init to zero
 
@@ -31,15 +25,26 @@ def create_conditional(num_qumodes: int = 2, num_qubits_per_mode: int = 2):
 def create_unconditional(num_qumodes: int = 2, num_qubits_per_mode: int = 2):
     qmr = c2qa.QumodeRegister(num_qumodes, num_qubits_per_mode)
     circuit = c2qa.CVCircuit(qmr)
-    for qumode in range(num_qumodes):
-        circuit.cv_initialize(0, qmr[qumode])
+    circuit.cv_initialize(0, [qmr[qumode] for qumode in range(num_qumodes)])
 
     return circuit, qmr
 
 
+def backend_options(backend):
+    """Simulate on the GPU when this Aer build supports it (e.g., qiskit-aer-gpu), otherwise on the CPU.
+
+    The tests only check whether amplitudes are (close to) zero, so single precision is sufficient.
+    """
+    options = {"precision": "single"}
+    if "statevector_gpu" in backend.available_methods():
+        options["method"] = "statevector_gpu"
+
+    return options
+
+
 def execute_circuit(circuit: c2qa.CVCircuit):
     backend = qiskit.Aer.get_backend("statevector_simulator")
-    job = qiskit.execute(circuit, backend)
+    job = qiskit.execute(circuit, backend, **backend_options(backend))
     result = job.result()
 
     return result
@@ -163,6 +168,94 @@ def test_displacement_twice():
     assert_unchanged(result, circuit)
 
 
+def test_fuse_cv():
+    circuit, qmr = create_unconditional()
+
+    alpha = random.random()
+    theta = random.random()
+    circuit.cv_d(alpha, qmr[0])
+    circuit.cv_r(theta, qmr[0])
+    circuit.cv_s(alpha, qmr[1])
+    circuit.cv_d(-alpha, qmr[0])
+    circuit.cv_bs(theta, qmr[0], qmr[1])
+    circuit.cv_r(theta, qmr[1])
+    circuit.cv_r(theta, qmr[1])
+    state = execute_circuit(circuit).get_statevector(circuit)
+
+    num_instructions = len(circuit.data)
+    circuit.fuse_cv()
+    fused_state = execute_circuit(circuit).get_statevector(circuit)
+
+    assert len(circuit.data) == num_instructions - 3
+    assert circuit.data[-1][0].name == "diagonal"
+    assert numpy.allclose(state, fused_state, atol=1e-5)
+
+
+def test_fuse_cv_classically_conditioned():
+    """Gates conditioned on a classical register must not be fused."""
+    qmr = c2qa.QumodeRegister(1, 2)
+    qr = qiskit.QuantumRegister(1)
+    cr = qiskit.ClassicalRegister(1)
+    circuit = c2qa.CVCircuit(qmr, qr, cr)
+    circuit.cv_initialize(0, qmr[0])
+
+    alpha = random.random()
+    circuit.cv_d(alpha, qmr[0])
+    circuit.measure(qr[0], cr[0])  # qr[0] is zero, so the condition below never holds
+    circuit.cv_d(-alpha, qmr[0])
+    circuit.data[-1][0].c_if(cr, 1)
+    state = execute_circuit(circuit).get_statevector(circuit)
+
+    num_instructions = len(circuit.data)
+    circuit.fuse_cv()
+    fused_state = execute_circuit(circuit).get_statevector(circuit)
+
+    assert len(circuit.data) == num_instructions
+    assert count_nonzero(state) > 1
+    assert numpy.allclose(state, fused_state, atol=1e-5)
+
+
+def test_fuse_cv_classically_conditioned_across_other_qumodes():
+    """A conditioned gate ends the run on its qumode, even with gates on other qubits in between."""
+    qmr = c2qa.QumodeRegister(2, 2)
+    qr = qiskit.QuantumRegister(1)
+    cr = qiskit.ClassicalRegister(1)
+    circuit = c2qa.CVCircuit(qmr, qr, cr)
+    circuit.cv_initialize(0, [qmr[0], qmr[1]])
+
+    alpha = random.random()
+    circuit.cv_d(alpha, qmr[0])
+    circuit.cv_s(alpha, qmr[1])
+    circuit.measure(qr[0], cr[0])  # qr[0] is zero, so the condition below never holds
+    circuit.cv_s(alpha, qmr[0])
+    circuit.data[-1][0].c_if(cr, 1)
+    circuit.cv_d(-alpha, qmr[0])
+    state = execute_circuit(circuit).get_statevector(circuit)
+
+    num_instructions = len(circuit.data)
+    circuit.fuse_cv()
+    fused_state = execute_circuit(circuit).get_statevector(circuit)
+
+    assert len(circuit.data) == num_instructions
+    assert circuit.data[4][0].condition is not None
+    assert numpy.allclose(state, fused_state, atol=1e-5)
+
+
+def test_conditional_native_vs_definition():
+    """Aer applies conditional gates natively, other simulators use their unitary definition."""
+    circuit, qmr, qr = create_conditional()
+
+    circuit.h(qr[0])
+    circuit.cv_d(random.random(), qmr[0])
+    circuit.cv_cnd_bs(random.random(), random.random(), qr[0], qmr[0], qmr[1])
+    circuit.cv_cnd_s(random.random(), random.random(), qr[1], qmr[1])
+
+    result = execute_circuit(circuit)
+    state = qiskit.quantum_info.Statevector.from_instruction(circuit)
+
+    assert numpy.allclose(result.get_statevector(circuit), state.data, atol=1e-5)
+
+
 def test_cond_displacement_gate_vs_two_separate():
     from qiskit.extensions import UnitaryGate
 
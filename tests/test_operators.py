@@ -84,3 +84,45 @@ class TestMatrices:
         rand = self.ops.s2(random.random())
 
         assert not numpy.allclose(one, rand)
+
+
+class TestCache:
+    """Verify repeated operators are reused instead of rebuilt"""
+
+    def setup_method(self, method):
+        self.ops = CVOperators(4)
+
+    def test_repeat(self):
+        alpha = random.random()
+
+        assert self.ops.d(alpha) is CVOperators(4).d(alpha)
+
+    def test_negated_is_adjoint(self):
+        alpha = random.random()
+
+        assert numpy.allclose(self.ops.d(-alpha), self.ops.d(alpha).conj().T)
+        assert numpy.allclose(self.ops.bs(-alpha), self.ops.bs(alpha).conj().T)
+
+    def test_read_only(self):
+        assert not self.ops.s(random.random()).flags.writeable
+
+    def test_large_not_cached(self):
+        ops = CVOperators(17)
+        g = random.random()
+
+        assert ops.bs(g) is not ops.bs(g)
+        assert numpy.allclose(ops.bs(-g), ops.bs(g).conj().T)
+
+
+def test_r_diagonal():
+    ops = CVOperators(4)
+    theta = random.random()
+
+    assert numpy.allclose(numpy.diag(ops.r_diagonal(theta)), ops.r(theta))
+
+
+def test_ladder_operators():
+    ops = CVOperators(4)
+
+    assert numpy.allclose(ops.N, ops.a_dag @ ops.a)
+    assert numpy.allclose(ops.a1 @ ops.a2_dag, ops.a2_dag @ ops.a1)